@@ -4,58 +4,133 @@ Solution using csv module to process employee data
 """
 
 import csv
+import sys
+from collections import Counter
+from contextlib import ExitStack
 
-def analyze_employee_data(file_path):
+def analyze_employee_data(file_path, experienced_csv_path=None):
     """
     Analyze employee CSV data to compute various statistics.
 
     Args:
         file_path: Path to employee CSV file
+        experienced_csv_path: Optional path to write experienced employees
+            to while scanning. When given, they are not kept in memory and
+            'experienced_employees' is an empty list.
 
     Returns:
         Dictionary with analysis results
     """
     # Initialize counters and accumulators
     total_employees = 0
-    department_counts = {}
+    department_counts = Counter()
     total_salary = 0
+    experienced_count = 0
     experienced_employees = []
 
     # Process file in one pass
-    with open(file_path, 'r') as file:
-        reader = csv.DictReader(file)
+    with ExitStack() as stack:
+        file = stack.enter_context(open(file_path, 'r'))
+        reader = csv.reader(file)
+
+        # Stream experienced employees straight to their own CSV if asked to
+        experienced_writer = None
+        if experienced_csv_path:
+            experienced_file = stack.enter_context(open(experienced_csv_path, 'w', newline=''))
+            experienced_writer = csv.writer(experienced_file)
+            experienced_writer.writerow(['name', 'department', 'years'])
+
+        # Look up column positions once from the header row, so each row
+        # is a plain list instead of a freshly built dict
+        header = next(reader, None)
+        if header is None:
+            # Empty file: no header, so there is nothing to count
+            return {
+                'total_employees': 0,
+                'department_counts': {},
+                'average_salary': 0,
+                'experienced_count': 0,
+                'experienced_employees': []
+            }
+        name_col = header.index('name')
+        department_col = header.index('department')
+        salary_col = header.index('salary')
+        years_col = header.index('years_experience')
 
         for row in reader:
             # Count total employees
             total_employees += 1
 
             # Count by department
-            department = row['department']
-            department_counts[department] = department_counts.get(department, 0) + 1
+            # Interned, so repeated department names share one string object
+            department = sys.intern(row[department_col])
+            department_counts[department] += 1
 
             # Accumulate salary
-            salary = float(row['salary'])
+            salary = float(row[salary_col])
             total_salary += salary
 
             # Track experienced employees (>5 years)
-            years = int(row['years_experience'])
+            years = int(row[years_col])
+            # Stored as (name, department, years) tuples, which are much
+            # smaller than a dict per employee
             if years > 5:
-                experienced_employees.append({
-                    'name': row['name'],
-                    'department': department,
-                    'years': years
-                })
+                experienced_count += 1
+                employee = (row[name_col], department, years)
+                if experienced_writer:
+                    experienced_writer.writerow(employee)
+                else:
+                    experienced_employees.append(employee)
 
     # Calculate average
     avg_salary = total_salary / total_employees if total_employees > 0 else 0
 
     # Return results
-    return {
+    results = {
         'total_employees': total_employees,
-        'department_counts': department_counts,
+        'department_counts': dict(department_counts),
         'average_salary': avg_salary,
+        'experienced_count': experienced_count,
         'experienced_employees': experienced_employees
     }
+    return results
+
+
+def analyze_employee_data_pandas(file_path):
+    """
+    Same analysis as analyze_employee_data, vectorized with pandas.
+
+    Worth it for large files, where the per-row float()/int() conversions
+    and dict updates of the csv version dominate the runtime.
+
+    Args:
+        file_path: Path to employee CSV file
+
+    Returns:
+        Dictionary with analysis results (same shape as analyze_employee_data)
+    """
+    import pandas as pd
+
+    # Only load the columns we need, already converted to numbers
+    df = pd.read_csv(
+        file_path,
+        usecols=['name', 'department', 'salary', 'years_experience'],
+        dtype={'salary': 'float64', 'years_experience': 'int32'}
+    )
+
+    total_employees = len(df)
+    avg_salary = df['salary'].sum() / total_employees if total_employees > 0 else 0
+
+    # Track experienced employees (>5 years)
+    experienced = df.loc[df['years_experience'] > 5, ['name', 'department', 'years_experience']]
+
+    return {
+        'total_employees': total_employees,
+        'department_counts': df['department'].value_counts().to_dict(),
+        'average_salary': float(avg_salary),
+        'experienced_count': len(experienced),
+        'experienced_employees': list(experienced.itertuples(index=False, name=None))
+    }
 
 
 def print_analysis(results):
@@ -72,9 +147,9 @@ def print_analysis(results):
 
     print(f"\nAverage Salary: ${results['average_salary']:,.2f}")
 
-    print(f"\nExperienced Employees (>5 years): {len(results['experienced_employees'])}")
-    for emp in results['experienced_employees']:
-        print(f"  - {emp['name']} ({emp['department']}): {emp['years']} years")
+    print(f"\nExperienced Employees (>5 years): {results['experienced_count']}")
+    for name, department, years in results['experienced_employees']:
+        print(f"  - {name} ({department}): {years} years")
 
     print("="*60)
 
@@ -104,15 +179,22 @@ if __name__ == "__main__":
     print("Sample data created: employees_sample.csv\n")
 
     # Analyze the data
-    results = analyze_employee_data('employees_sample.csv')
+    # Bonus: experienced employees are saved to a new CSV during the same pass
+    results = analyze_employee_data(
+        'employees_sample.csv',
+        experienced_csv_path='experienced_employees.csv'
+    )
+
+    # The experienced employees went to their CSV rather than into memory,
+    # so read them back from it for the listing
+    with open('experienced_employees.csv', 'r', newline='') as file:
+        reader = csv.reader(file)
+        next(reader)
+        results['experienced_employees'] = [
+            (name, department, int(years)) for name, department, years in reader
+        ]
 
     # Print results
     print_analysis(results)
 
-    # Bonus: Save experienced employees to new CSV
-    with open('experienced_employees.csv', 'w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=['name', 'department', 'years'])
-        writer.writeheader()
-        writer.writerows(results['experienced_employees'])
-
     print("\nExperienced employees saved to: experienced_employees.csv")
@@ -3,6 +3,7 @@ Lesson 04 - Exercise 2: Column Addition with Pandas
 Solution demonstrating adding calculated columns to a DataFrame
 """
 
+import numpy as np
 import pandas as pd
 
 def add_calculated_columns(df):
@@ -16,18 +17,17 @@ def add_calculated_columns(df):
         DataFrame with added columns: total_price, tax, final_price
     """
     # Add total_price column
-    df['total_price'] = df['quantity'] * df['unit_price']
+    total_price = df['quantity'].to_numpy() * df['unit_price'].to_numpy()
 
-    # Add tax column (8% of total_price)
-    df['tax'] = df['total_price'] * 0.08
-
-    # Add final_price column (total_price + tax)
-    df['final_price'] = df['total_price'] + df['tax']
+    # Add tax (8% of total_price) and final_price (total_price + tax) columns.
+    # final_price is folded into a single multiply: total_price * 1.08
+    tax = total_price * 0.08
+    final_price = total_price * 1.08
 
     # Round to 2 decimal places for currency
-    df['total_price'] = df['total_price'].round(2)
-    df['tax'] = df['tax'].round(2)
-    df['final_price'] = df['final_price'].round(2)
+    df['total_price'] = np.round(total_price, 2)
+    df['tax'] = np.round(tax, 2)
+    df['final_price'] = np.round(final_price, 2)
 
     return df
 
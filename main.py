@@ -10,19 +10,17 @@
 #   IMPORTS/SETUP   #
 #####################
 
-import getpass  # for hiding input and disabling echo
 import os
+import re
 import secrets
 import sys
 import threading
 import time
 from random import randint
 
-from pyboxen import boxen
 from rich import print as rprint
 from rich.console import Console
 from rich.markup import escape
-from rich.table import Table
 from rich.text import Text
 
 try:
@@ -49,8 +47,24 @@ except (ImportError, ModuleNotFoundError):
 
 
 pwd_brkr = Sandbox("pwd-brkr")
-allowed_characters = [chr(i) for i in range(32, 127)]
+# The charset is printable ASCII, kept as one packed bytes object. The
+# tables below and the Numba kernel all read from it, and allowed_string is
+# its str view for iterating chars.
+allowed_bytes = bytes(range(32, 127))
+allowed_string = allowed_bytes.decode("ascii")
+# Brute-force attempts needed to reach each ASCII code, 0 outside the charset;
+# a char's position in the charset is its cost minus one
+attempt_costs = bytes(allowed_bytes.find(b) + 1 for b in range(128))
+# Maps any random byte onto the charset. Bytes past the last whole multiple
+# of the charset size are rejected so every char stays equally likely.
+random_byte_table = bytes(allowed_bytes[b % len(allowed_bytes)] for b in range(256))
+random_byte_rejects = bytes(range(256 - 256 % len(allowed_bytes), 256))
+# Pre-styled chars for the detail view, so the hot loop never builds styles
+miss_texts = [Text(c, style="dim white strike") for c in allowed_string]
+hit_texts = [Text(c, style="bold bright_green") for c in allowed_string]
 console = Console()
+render_interval = 0.05  # seconds between detail frames, i.e. 20 fps
+numba_min_length = 100_000  # shorter targets aren't worth Numba's load time
 loading_messages = [
     "Trying 'password123' again..",
     "Asking the password nicely..",
@@ -92,6 +106,8 @@ class SpinnerThread(threading.Thread):
     ):
         super().__init__()
         self._stop_event = threading.Event()
+        self._pause_event = threading.Event()
+        self._idle_event = threading.Event()
         self.console = console
         self.messages = messages if messages else ["Loading..."]
         self.daemon = True
@@ -99,45 +115,106 @@ class SpinnerThread(threading.Thread):
         self.spinner_frame = frames[:]
         self.frame_speed = frame_tick
         self.message_delay = message_delay
-        self._lock = threading.Lock()
+
+        max_len = max(len(m) for m in self.messages)
+        self._pad = max_len + 2
+        self._clear_line = b"\r" + b" " * self._pad + b"\r"
+
+        # Every frame/message pair is rendered and encoded up front, so a
+        # tick is just a table lookup and a single write
+        self._rendered = [
+            [
+                ("\r\033[2m" + f"{frame} {msg}".ljust(self._pad) + "\033[0m").encode(
+                    "utf-8"
+                )
+                for msg in self.messages
+            ]
+            for frame in self.spinner_frame
+        ]
 
     def stop(self):
         self._stop_event.set()
 
+    def pause(self):
+        # Returns once the spinner has cleared its line, so the caller can
+        # print without the next frame landing on top of it
+        self._pause_event.set()
+        if self.is_alive():
+            self._idle_event.wait(timeout=1.0)
+
+    def resume(self):
+        self._idle_event.clear()
+        self._pause_event.clear()
+
     def run(self):
         try:
+            # Everything the loop touches is bound to a local once up front
+            rendered = self._rendered
+            n_frames = len(rendered)
+            n_msgs = len(self.messages)
+            # Frames go straight to the file descriptor, skipping the
+            # sys.stdout buffer; anything still sitting in it is flushed
+            # first so it isn't written out after the spinner's frames
+            sys.stdout.flush()
+            fd = sys.stdout.fileno()
+            write = os.write
+            is_set = self._stop_event.is_set
+            wait = self._stop_event.wait
+            is_paused = self._pause_event.is_set
+            idle = self._idle_event
+            monotonic = time.monotonic
+            delay = self.message_delay
+            tick = self.frame_speed
+
             i = 0
             msg_idx = 0
-            last_msg_switch = time.time()
+            last_msg_switch = monotonic()
+
+            # This thread is the only writer while the spinner runs, so the
+            # writes don't need a lock.
+            while not is_set():
+                if is_paused():
+                    if not idle.is_set():
+                        write(fd, self._clear_line)
+                        idle.set()
+                    wait(tick)
+                    continue
+
+                write(fd, rendered[i % n_frames][msg_idx])
+
+                now = monotonic()
+                if now - last_msg_switch >= delay:
+                    msg_idx = (msg_idx + 1) % n_msgs
+                    last_msg_switch = now
+
+                # Wakes up as soon as stop() is called instead of sleeping
+                # out the rest of the frame
+                wait(tick)
+                i += 1
 
-            max_len = max(len(m) for m in self.messages) if self.messages else 20
+            write(fd, self._clear_line)
+        except Exception as e:
+            pass
 
-            DIM = "\033[2m"
-            RESET = "\033[0m"
 
-            while not self._stop_event.is_set():
-                with self._lock:
-                    current_msg = self.messages[msg_idx]
-                    current_frame = self.spinner_frame[i % len(self.spinner_frame)]
+class _NullSpinner:
+    # Stands in for SpinnerThread when stdout isn't a terminal, so callers
+    # don't need to check whether a spinner is running
 
-                    output = f"{current_frame} {current_msg}"
+    def start(self):
+        pass
 
-                    padded_output = output.ljust(max_len + 2)
-                    sys.stdout.write(f"\r{DIM}{padded_output}{RESET}")
-                    sys.stdout.flush()
+    def stop(self):
+        pass
 
-                if time.time() - last_msg_switch >= self.message_delay:
-                    msg_idx = (msg_idx + 1) % len(self.messages)
-                    last_msg_switch = time.time()
+    def join(self, timeout=None):
+        pass
 
-                time.sleep(self.frame_speed)
-                i += 1
+    def pause(self):
+        pass
 
-            with self._lock:
-                sys.stdout.write("\r" + " " * (max_len + 2) + "\r")
-                sys.stdout.flush()
-        except Exception as e:
-            pass
+    def resume(self):
+        pass
 
 
 ###################
@@ -154,231 +231,394 @@ def pwd_break(
         rprint("[red][x] ERROR: Empty password provided[/red]")
         return
 
+    # Deleting every allowed byte leaves exactly the chars that can't be
+    # cracked. Past this check the target is plain ASCII in 32..126, so the
+    # kernel can index its tables without any per-char checks.
+    pwd_bytes = pwd.encode("utf-8", "surrogatepass")
+    invalid = pwd_bytes.translate(None, allowed_bytes)
+    if invalid:
+        bad_chars = invalid.decode("utf-8", "surrogatepass")
+        rprint(
+            f"[red][x] ERROR: Characters outside the allowed set: {escape(repr(bad_chars))}[/red]"
+        )
+        return
+
+    spinner = None
+    live = None
+
     try:
-        break_attempt = ""
         effective_rate_limit = set_rate_limit
         access_count = 0
+        rate_limit_message = (
+            f"[magenta][!] RATE LIMIT EXCEEDED - Cooldown: {rate_cooldown}s[/magenta]"
+        )
 
-        spinner = SpinnerThread(console, loading_messages, frames=allowed_characters)
-        spinner.start()
+        # The detail view is only worth rendering for a human watching a
+        # terminal; piped or redirected output skips it altogether.
+        if show_detail and console.is_terminal:
+            from rich.live import Live
+
+            # Nothing is rendered per candidate; a frame is only built when
+            # _throttled_refresh decides to draw one.
+            live = Live(Text(), console=console, auto_refresh=False, transient=True)
+            live.start()
+            last_render = 0.0
+        elif console.is_terminal:
+            spinner = SpinnerThread(console, loading_messages, frames=allowed_string)
+            spinner.start()
+        else:
+            # Same for the spinner: nothing would see it, it would only
+            # leave escape codes in the output
+            spinner = _NullSpinner()
+
+        if live:
+            # Cracked chars are collected as bytes and only decoded when a
+            # frame is drawn; growing a str would copy the whole prefix on
+            # every position.
+            cracked = bytearray()
+
+            for target in pwd_bytes:
+                if (
+                    effective_rate_limit is not None
+                    and access_count >= effective_rate_limit
+                ):
+                    access_count = 0
+                    live.console.print(rate_limit_message)
+                    # The next candidate redraws the prefix straight away,
+                    # since the countdown held off the throttle for a while
+                    _live_countdown(live, rate_cooldown)
+
+                # The target char is known, so jump straight to it; the
+                # candidates before it are only walked for the display.
+                cost = attempt_costs[target]
+                target_idx = cost - 1
+
+                # Everything before the target is a miss and the target is
+                # the hit, so no candidate ever has to be compared.
+                for miss_text in miss_texts[:target_idx]:
+                    last_render = _throttled_refresh(
+                        live, last_render, cracked, miss_text
+                    )
 
-        for position in range(len(pwd)):
-            if (
-                effective_rate_limit is not None
-                and access_count >= effective_rate_limit
-            ):
-                spinner.stop()
-                spinner.join(timeout=1.0)
+                last_render = _throttled_refresh(
+                    live, last_render, cracked, hit_texts[target_idx]
+                )
 
-                rprint(
-                    f"\n[magenta][!] RATE LIMIT EXCEEDED - Cooldown: {rate_cooldown}s[/magenta]"
+                access_count += cost
+                cracked.append(target)
+        else:
+            crack_kernel, as_buffer = _load_crack_kernel(len(pwd_bytes))
+            target = as_buffer(pwd_bytes)
+            costs = as_buffer(attempt_costs)
+            rate_limit = effective_rate_limit or 0
+            position = 0
+
+            # The kernel runs until the target is cracked or the rate limit
+            # is hit; cooldowns are handled here, between kernel calls.
+            while True:
+                position, access_count = crack_kernel(
+                    target, costs, position, access_count, rate_limit
                 )
+                if position == len(pwd_bytes):
+                    break
+
+                spinner.pause()
+                rprint(f"\n{rate_limit_message}")
+
                 access_count = 0
                 time.sleep(rate_cooldown)
 
-                spinner = SpinnerThread(console, loading_messages)
-                spinner.start()
+                spinner.resume()
 
-            for char in allowed_characters:
-                candidate_char = break_attempt + char
+            # Every position was checked against the target, so it's all cracked
+            cracked = pwd_bytes
 
-                # styled = Text()
+        _stop_display(spinner, live)
 
-                # if break_attempt:
-                #     styled.append(break_attempt, style="dim bright_green")
+        break_attempt = cracked.decode("ascii")
+        rprint(
+            f"[bold bright_green][+] Cracked stringset: {escape(break_attempt)}[/bold bright_green]"
+        )
 
-                # if pwd.startswith(candidate_char):
-                #     styled.append(char, style="bold bright_green")
-                # else:
-                #     styled.append(char, style="dim white strike")
+    except KeyboardInterrupt:
+        _stop_display(spinner, live)
+        rprint("\n[yellow][!] Cracking interrupted by user[/yellow]")
+    except Exception as e:
+        _stop_display(spinner, live)
+        rprint(f"[red][x] ERROR during cracking: {str(e)}[/red]")
 
-                # live.update(styled)
 
-                access_count += 1
+def _crack_kernel(target, attempt_costs, position, access_count, rate_limit):
+    # Pure integer work over byte buffers, so Numba can compile it. Returns
+    # early, with the position reached, when a rate-limit cooldown is due.
+    while position < len(target):
+        if rate_limit > 0 and access_count >= rate_limit:
+            break
+        access_count += attempt_costs[target[position]]
+        position += 1
+    return position, access_count
 
-                if pwd.startswith(candidate_char):
-                    break_attempt += char
-                    break
 
-            if break_attempt == pwd:
-                break
+_crack_backend = None
 
-        spinner.stop()
-        spinner.join(timeout=1.0)
 
-        rprint("[bold bright_green][+] Cracked stringset. [/bold bright_green]")
+def _load_crack_kernel(length):
+    # The plain-Python kernel cracks any target a user would type in
+    # microseconds, while importing Numba and loading the compiled kernel
+    # takes the best part of a second. So Numba, which is optional, is only
+    # looked for once a target is long enough to pay that back.
+    global _crack_backend
 
-    except KeyboardInterrupt:
+    if length < numba_min_length:
+        return _crack_kernel, bytes
+
+    if _crack_backend is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except (ImportError, ModuleNotFoundError):
+            _crack_backend = (_crack_kernel, bytes)
+        else:
+            _crack_backend = (
+                njit(cache=True)(_crack_kernel),
+                lambda data: np.frombuffer(data, dtype=np.uint8),
+            )
+
+    return _crack_backend
+
+
+def _throttled_refresh(live, last_render, cracked, candidate):
+    # Most candidates would only be on screen for a few microseconds, so
+    # frames in between are skipped. A drawn frame is the cracked prefix as
+    # one span followed by the candidate being tried.
+    now = time.monotonic()
+    if now - last_render >= render_interval:
+        frame = Text(cracked.decode("ascii"), style="dim bright_green")
+        frame.append_text(candidate)
+        live.update(frame, refresh=True)
+        return now
+    return last_render
+
+
+def _live_countdown(live, seconds):
+    # Count the cooldown down in the detail view instead of freezing it
+    deadline = time.monotonic() + seconds
+    while (remaining := deadline - time.monotonic()) > 0:
+        live.update(
+            Text(f"[!] COOLDOWN {remaining:.1f}s", style="magenta"), refresh=True
+        )
+        time.sleep(min(render_interval, remaining))
+
+
+def _stop_display(spinner, live):
+    if spinner:
         spinner.stop()
         spinner.join(timeout=1.0)
-        rprint("\n[yellow][!] Cracking interrupted by user[/yellow]")
-    except Exception as e:
-        if "spinner" in locals():
-            spinner.stop()
-            spinner.join(timeout=1.0)
-        rprint(f"[red][x] ERROR during cracking: {str(e)}[/red]")
+    if live:
+        live.stop()
 
 
-def handle_cmd(cmd: str):
-    if not cmd or cmd.isspace():
-        return None
+def random_stringset(length: int) -> str:
+    # Draw random bytes in batches instead of one secrets.choice (and one
+    # urandom call) per char, and map a whole batch onto the charset with a
+    # single translate() call.
+    chars = bytearray()
 
-    try:
-        if cmd.startswith("exit"):
-            if cmd.endswith(" --help") or cmd.endswith(" -h"):
-                rprint("[bright_yellow][?] Usage: exit[/bright_yellow]")
-                rprint("[dim white]    Terminates the pwd-brkr session[/dim white]\n")
-                return None
-            rprint("[dim cyan][-] Terminating session...[/dim cyan]")
-            sys.exit(0)
-
-        elif cmd.startswith("random-break") or cmd.startswith("randbreak"):
-            args = cmd.split()
-            min_len = 8
-            max_len = 50
-            rate_limit = None
-            rate_cooldown = 5
-            default = len(args) == 1
-
-            if cmd.endswith(" --help") or cmd.endswith(" -h"):
-                rprint(
-                    "[bright_yellow][?] Usage: random-break <max (if alone) else min>? <max>? <rate_limit>? <rate_limit_cooldown>?[/bright_yellow]\n"
-                )
-                return None
+    while len(chars) < length:
+        raw = secrets.token_bytes((length - len(chars)) * 2)
+        chars += raw.translate(random_byte_table, random_byte_rejects)
 
-            try:
-                if len(args) == 2:
-                    max_len = int(args[1])
-                    if max_len < 1:
-                        raise ValueError("Max length must be positive")
-                elif len(args) == 3:
-                    min_len = int(args[1])
-                    max_len = int(args[2])
-                    if min_len < 1 or max_len < min_len:
-                        raise ValueError("Invalid min/max range")
-                elif len(args) == 4:
-                    min_len = int(args[1])
-                    max_len = int(args[2])
-                    rate_limit = int(args[3])
-                    if min_len < 1 or max_len < min_len:
-                        raise ValueError("Invalid min/max range")
-                    if rate_limit < 1:
-                        raise ValueError("Rate limit must be positive")
-                elif len(args) == 5:
-                    min_len = int(args[1])
-                    max_len = int(args[2])
-                    rate_limit = int(args[3])
-                    rate_cooldown = int(args[4])
-                    if min_len < 1 or max_len < min_len:
-                        raise ValueError("Invalid min/max range")
-                    if rate_limit < 1:
-                        raise ValueError("Rate limit must be positive")
-                    if rate_cooldown < 0:
-                        raise ValueError("Cooldown must be non-negative")
-                elif len(args) > 5:
-                    rprint(
-                        "[red][x] ERROR: Too many arguments. Use --help for usage info.[/red]"
-                    )
-                    return None
+    return chars[:length].decode("ascii")
 
-            except ValueError as e:
-                rprint(f"[red][x] ERROR: Invalid argument - {str(e)}[/red]")
-                rprint(
-                    "[dim white]    Use --help flag for usage information[/dim white]"
-                )
-                return None
 
-            try:
-                length = randint(min_len, max_len)
-                random_pwd = "".join(
-                    secrets.choice(allowed_characters) for _ in range(length)
-                )
-                # Escape the password to prevent Rich markup interpretation
-                escaped_pwd = escape(random_pwd)
-                rprint(
-                    f"[bright_yellow][*] TARGET GENERATED: {escaped_pwd}[/bright_yellow]"
-                )
-                rprint(f"[dim white]    Length: {length} characters[/dim white]\n")
-            except Exception as e:
-                rprint(f"[red][x] ERROR: Failed to generate password - {str(e)}[/red]")
-                return None
+# How random-break's numbers map onto (min_len, max_len, rate_limit,
+# rate_cooldown), keyed by how many were given. A lone number is the max.
+random_break_layouts = {
+    0: lambda a: (8, 50, None, 5),
+    1: lambda a: (8, a[0], None, 5),
+    2: lambda a: (a[0], a[1], None, 5),
+    3: lambda a: (a[0], a[1], a[2], 5),
+    4: lambda a: (a[0], a[1], a[2], a[3]),
+}
 
-            try:
-                confirmation = (
-                    input("[>] Initiate crack sequence (y/n)? ").strip().lower()
-                )
-                print()
-            except (EOFError, KeyboardInterrupt):
-                rprint("\n[yellow][!] Input cancelled[/yellow]")
-                return None
-
-            if confirmation == "y":
-                pwd_break(
-                    random_pwd, set_rate_limit=rate_limit, rate_cooldown=rate_cooldown
-                )
-                print()
-            elif confirmation == "n":
-                rprint("[dim cyan][-] Crack sequence cancelled[/dim cyan]")
-            else:
-                rprint("[yellow][!] Invalid response - cancelled[/yellow]")
-
-        elif cmd.startswith("break"):
-            args = cmd.split()
-
-            if len(args) < 2:
-                rprint("[red][x] ERROR: Need a stringset for the second argument.")
-                return None
-
-            pwd_break(args[1])
-
-        elif cmd.startswith("try-printallowedchar") or cmd.startswith("chars"):
-            if cmd.endswith(" --help") or cmd.endswith(" -h"):
-                rprint("[bright_yellow][?] Usage: try-printallowedchar[/bright_yellow]")
-                rprint(
-                    "[dim white]    Displays the full character set used for cracking[/dim white]\n"
-                )
-                return None
+
+def handle_exit(cmd: str):
+    if cmd.endswith((" --help", " -h")):
+        rprint("[bright_yellow][?] Usage: exit[/bright_yellow]")
+        rprint("[dim white]    Terminates the pwd-brkr session[/dim white]\n")
+        return None
+    rprint("[dim cyan][-] Terminating session...[/dim cyan]")
+    sys.exit(0)
+
+
+def handle_random_break(cmd: str):
+    if cmd.endswith((" --help", " -h")):
+        rprint(
+            "[bright_yellow][?] Usage: random-break <max (if alone) else min>? <max>? <rate_limit>? <rate_limit_cooldown>?[/bright_yellow]\n"
+        )
+        return None
+
+    try:
+        nums = list(map(int, cmd.split()[1:]))
+        layout = random_break_layouts.get(len(nums))
+        if layout is None:
             rprint(
-                f"[bright_cyan][*] Allowed character set ({len(allowed_characters)} chars):[/bright_cyan]"
+                "[red][x] ERROR: Too many arguments. Use --help for usage info.[/red]"
             )
-            # Escape the character list to prevent Rich markup interpretation
-            escaped_chars = escape(str(allowed_characters))
-            rprint(escaped_chars)
-            print()
-
-        elif cmd.startswith("list") or cmd.startswith("ls"):
-            if cmd.endswith(" --help") or cmd.endswith(" -h"):
-                rprint("[bright_yellow][?] Usage: list[/bright_yellow]")
-                rprint(
-                    "[dim white]    Displays all available commands with usage info[/dim white]\n"
-                )
-                return None
+            return None
+
+        min_len, max_len, rate_limit, rate_cooldown = layout(nums)
+
+        if not 1 <= min_len <= max_len:
+            raise ValueError("Invalid min/max range")
+        if rate_limit is not None and rate_limit < 1:
+            raise ValueError("Rate limit must be positive")
+        if rate_cooldown < 0:
+            raise ValueError("Cooldown must be non-negative")
+
+    except ValueError as e:
+        rprint(f"[red][x] ERROR: Invalid argument - {str(e)}[/red]")
+        rprint("[dim white]    Use --help flag for usage information[/dim white]")
+        return None
+
+    try:
+        length = randint(min_len, max_len)
+        random_pwd = random_stringset(length)
+        # Escape the password to prevent Rich markup interpretation
+        escaped_pwd = escape(random_pwd)
+        rprint(f"[bright_yellow][*] TARGET GENERATED: {escaped_pwd}[/bright_yellow]")
+        rprint(f"[dim white]    Length: {length} characters[/dim white]\n")
+    except Exception as e:
+        rprint(f"[red][x] ERROR: Failed to generate password - {str(e)}[/red]")
+        return None
+
+    try:
+        confirmation = input("[>] Initiate crack sequence (y/n)? ").strip().lower()
+        print()
+    except (EOFError, KeyboardInterrupt):
+        rprint("\n[yellow][!] Input cancelled[/yellow]")
+        return None
+
+    if confirmation == "y":
+        pwd_break(random_pwd, set_rate_limit=rate_limit, rate_cooldown=rate_cooldown)
+        print()
+    elif confirmation == "n":
+        rprint("[dim cyan][-] Crack sequence cancelled[/dim cyan]")
+    else:
+        rprint("[yellow][!] Invalid response - cancelled[/yellow]")
+
+
+def handle_break(cmd: str):
+    args = cmd.split()
+
+    if len(args) < 2:
+        rprint("[red][x] ERROR: Need a stringset for the second argument.")
+        return None
+
+    pwd_break(args[1])
+
+
+def handle_clear(cmd: str):
+    if cmd.endswith((" --help", " -h")):
+        rprint("[bright_yellow][?] Usage: clear[/bright_yellow]")
+        rprint("[dim white]    Clears the terminal screen[/dim white]\n")
+        return None
+    # Rich writes the clear/home escape codes itself (and handles legacy
+    # Windows consoles), instead of spawning a shell to run clear
+    console.clear()
+
+
+def handle_print_allowed(cmd: str):
+    if cmd.endswith((" --help", " -h")):
+        rprint("[bright_yellow][?] Usage: try-printallowedchar[/bright_yellow]")
+        rprint(
+            "[dim white]    Displays the full character set used for cracking[/dim white]\n"
+        )
+        return None
+    rprint(
+        f"[bright_cyan][*] Allowed character set ({len(allowed_bytes)} chars):[/bright_cyan]"
+    )
+    # Escape the character list to prevent Rich markup interpretation
+    escaped_chars = escape(str(list(allowed_string)))
+    rprint(escaped_chars)
+    print()
+
+
+def handle_list(cmd: str):
+    if cmd.endswith((" --help", " -h")):
+        rprint("[bright_yellow][?] Usage: list[/bright_yellow]")
+        rprint(
+            "[dim white]    Displays all available commands with usage info[/dim white]\n"
+        )
+        return None
+
+    print()
+    console.print(_load_command_table())
+    print()
+
+
+_command_table = None
+
+
+def _load_command_table():
+    # The registry never changes, so the Table is built on the first 'list'
+    # and reused after that
+    global _command_table
+
+    if _command_table is None:
+        from rich.table import Table
+
+        list_of_commands = Table(
+            title="[COMMAND REGISTRY]", title_style="bold bright_cyan"
+        )
+        list_of_commands.add_column("#", style="dim white", no_wrap=True)
+        list_of_commands.add_column("Command", style="bright_cyan")
+        list_of_commands.add_column("Arguments", style="bright_yellow")
+        list_of_commands.add_column("Description", style="dim white")
+
+        list_of_commands.add_row(
+            "1",
+            "random-break",
+            "<max>\n<min> <max>\n<min> <max> <rate>\n<min> <max> <rate> <cd>",
+            "Generate & crack random stringset\nUse --help for details",
+        )
+        list_of_commands.add_row(
+            "2", "try-printallowedchar", "(none)", "Display allowed character set"
+        )
+        list_of_commands.add_row(
+            "3", "break", "<stringset>", "Crack the given stringset"
+        )
+        list_of_commands.add_row("4", "clear", "(none)", "Clear the screen")
+        list_of_commands.add_row("5", "list", "(none)", "Show this command registry")
+        list_of_commands.add_row("6", "exit", "(none)", "Terminate session")
+        _command_table = list_of_commands
+
+    return _command_table
 
-            print()
-            list_of_commands = Table(
-                title="[COMMAND REGISTRY]", title_style="bold bright_cyan"
-            )
-            list_of_commands.add_column("#", style="dim white", no_wrap=True)
-            list_of_commands.add_column("Command", style="bright_cyan")
-            list_of_commands.add_column("Arguments", style="bright_yellow")
-            list_of_commands.add_column("Description", style="dim white")
-
-            list_of_commands.add_row(
-                "1",
-                "random-break",
-                "<max>\n<min> <max>\n<min> <max> <rate>\n<min> <max> <rate> <cd>",
-                "Generate & crack random stringset\nUse --help for details",
-            )
-            list_of_commands.add_row(
-                "2", "try-printallowedchar", "(none)", "Display allowed character set"
-            )
-            list_of_commands.add_row(
-                "3", "list", "(none)", "Show this command registry"
-            )
-            list_of_commands.add_row("4", "exit", "(none)", "Terminate session")
-            console.print(list_of_commands)
-            print()
 
+HANDLERS = {
+    "exit": handle_exit,
+    "random-break": handle_random_break,
+    "randbreak": handle_random_break,
+    "break": handle_break,
+    "clear": handle_clear,
+    "cls": handle_clear,
+    "try-printallowedchar": handle_print_allowed,
+    "chars": handle_print_allowed,
+    "list": handle_list,
+    "ls": handle_list,
+}
+
+
+def handle_cmd(cmd: str):
+    if not cmd or cmd.isspace():
+        return None
+
+    try:
+        handler = HANDLERS.get(cmd.partition(" ")[0])
+
+        if handler:
+            handler(cmd)
         else:
             rprint(f"[red][x] UNKNOWN COMMAND: '{cmd}'[/red]")
 
@@ -398,10 +638,29 @@ def handle_cmd(cmd: str):
 
 
 def main():
+    from pyboxen import boxen
+
+    try:
+        # Gives input() arrow-key history and line editing where available
+        import readline
+    except ImportError:
+        readline = None
+
     try:
         prompt = Text("[pwd-brkr] # ", style="bright_cyan")
         prompt.stylize("bright_white", 11, 13)
 
+        # Render the prompt to a plain string once and hand it to input(),
+        # instead of running it through Rich on every loop
+        with console.capture() as capture:
+            console.print(prompt, end="")
+        prompt_str = capture.get()
+        if readline and sys.stdin.isatty() and sys.stdout.isatty():
+            # input() only goes through readline on a terminal, and readline
+            # has to be told the escape codes take no space, or it miscounts
+            # the prompt width while editing
+            prompt_str = re.sub(r"(\x1b\[[0-9;]*m)", "\001\\1\002", prompt_str)
+
         print(
             boxen(
                 """
@@ -429,8 +688,7 @@ def main():
 
         while True:
             try:
-                rprint(prompt, end="")
-                user_cmd = input().strip()
+                user_cmd = input(prompt_str).strip()
 
                 handle_cmd(user_cmd)
 
@@ -449,15 +707,12 @@ def main():
         sys.exit(1)
 
 
-if __name__ == "__main__" and not pwd_brkr.is_sandbox_mode:
-    main()
-
-
 ###############
 #   SANDBOX   #
 ###############
 
-if pwd_brkr.is_sandbox_mode:
+
+def _run_sandbox():
     try:
         pwd_brkr.init()
         pwd_brkr.new_instance("Rich With rprint")
@@ -484,3 +739,10 @@ if pwd_brkr.is_sandbox_mode:
         rprint("HEY")
     except Exception as e:
         rprint(f"[red][x] Sandbox error: {str(e)}[/red]")
+
+
+if __name__ == "__main__":
+    if pwd_brkr.is_sandbox_mode:
+        _run_sandbox()
+    else:
+        main()